@@ -1,6 +1,7 @@
 import math
 import os
 import shutil
+import unittest.mock
 
 from _unittest.conftest import config
 from _unittest.conftest import local_path
@@ -1530,6 +1531,40 @@ class TestClass:
         array.cells[0][1].component = array.component_names[3]
         assert array.cells[0][1].component == array.component_names[3]
 
+        model_setup = unittest.mock.MagicMock(wraps=hfss_array.omodelsetup)
+        with unittest.mock.patch.object(hfss_array, "_omodel_setup", model_setup):
+            assert array.begin_batch()
+            array.cells[1][1].rotation = 180
+            array.cells[1][2].rotation = 180
+            assert model_setup.EditArray.call_count == 0
+            assert array.end_batch()
+            assert model_setup.EditArray.call_count == 1
+            assert array.cells[1][1].rotation == 180
+            assert array.cells[1][2].rotation == 180
+
+            model_setup.EditArray.reset_mock()
+            array.cells[1][1].rotation = 180
+            assert model_setup.EditArray.call_count == 0
+
+            with array.batch_updates():
+                array.cells[1][1].rotation = 90
+                array.cells[1][2].rotation = 90
+                assert model_setup.EditArray.call_count == 0
+            assert model_setup.EditArray.call_count == 1
+            assert array.cells[1][1].rotation == 90
+            assert array.cells[1][2].rotation == 90
+
+            model_setup.EditArray.reset_mock()
+            assert array.begin_batch()
+            with array.batch_updates():
+                array.cells[1][1].rotation = 180
+            assert model_setup.EditArray.call_count == 0
+            array.cells[1][2].rotation = 180
+            assert array.end_batch()
+            assert model_setup.EditArray.call_count == 1
+            assert array.cells[1][1].rotation == 180
+            assert array.cells[1][2].rotation == 180
+
         hfss_array.component_array["A1"].name = "Array_new"
         assert hfss_array.component_array_names[0] == "Array_new"
         hfss_array.component_array["Array_new"].name = "A1"
@@ -5759,6 +5759,8 @@ class Hfss(FieldAnalysis3D, object):
             self.omodelsetup.EditArray(args)
             if settings.aedt_version < "2024.1":
                 self.save_project()
+            elif array_name in self.component_array:
+                self.component_array[array_name].update_properties()
         else:
             self.omodelsetup.AssignArray(args)
             if settings.aedt_version < "2024.1":
@@ -1,12 +1,86 @@
 from __future__ import absolute_import
 
-from collections import OrderedDict
+from collections import defaultdict
+from contextlib import contextmanager
+import csv
+import io
+from itertools import compress
+from itertools import product
 import os
 import re
 
 from pyaedt import pyaedt_function_handler
 from pyaedt.generic.general_methods import _uname
-from pyaedt.generic.general_methods import read_csv
+
+_ROTATION_RE = re.compile(r"(?P<angle>[+-]?\d+(?:\.\d+)?)\s*(?P<unit>[a-zA-Z]+)")
+
+
+def _cells_to_string(cells, labels):
+    """Format a list of cells as expected by the ``EditArray`` method.
+
+    Parameters
+    ----------
+    cells : list
+        List of cell indices, cells being numbered row by row from ``0``.
+    labels : list
+        Label of each cell, like ``"[1, 1]"``, numbered the same way.
+
+    Returns
+    -------
+    str
+        Cells formatted like ``"[1, 1], [1, 2]"``.
+    """
+    return ", ".join([labels[index] for index in cells])
+
+
+def _parse_cell_info(cell):
+    """Parse a cell of the array matrix exported to a CSV file.
+
+    Parameters
+    ----------
+    cell : str
+        Cell information in the ``Component_index:Rotation_angle:Active_or_Passive`` format.
+
+    Returns
+    -------
+    tuple
+        Component index, rotation, and active state of the cell. The component index is ``-1`` for an empty cell.
+    """
+    split_elements = cell.split(":")
+    if not split_elements[0]:
+        return -1, 0, False
+    component_index = int(split_elements[0])
+
+    # Some elements might not have the rotation and active/passive status, so we check for their existence
+    if len(split_elements) == 1:
+        return component_index, 0, True
+    # Rotations are exported in degrees, like ``90.0deg``, so the regular expression is only a fallback
+    rotation_str = split_elements[1]
+    rotation = None
+    if rotation_str.endswith("deg"):
+        try:
+            rotation = int(float(rotation_str[:-3]))
+        except (ValueError, OverflowError):
+            pass
+    if rotation is None:
+        rotation_match = _ROTATION_RE.match(rotation_str)
+        if not rotation_match or rotation_match.group("unit") != "deg":
+            return component_index, 0, False
+        rotation = int(float(rotation_match.group("angle")))
+    if len(split_elements) > 2:
+        return component_index, rotation, bool(int(split_elements[2]))
+    return component_index, rotation, True
+
+
+class _CellInfoCache(dict):
+    """Cell information parsed from the CSV file, by cell string.
+
+    Arrays use few distinct cell strings, so each one is parsed only once.
+    """
+
+    def __missing__(self, cell):
+        cell_info = self[cell] = _parse_cell_info(cell)
+        return cell_info
 
 
 class ComponentArray(object):
@@ -29,6 +103,35 @@ class ComponentArray(object):
     >>> array = aedtapp.component_array[array_names[0]]
     """
 
+    __slots__ = (
+        "logger",
+        "update_cells",
+        "_cell_components",
+        "_cell_rotations",
+        "_cell_active",
+        "__app",
+        "__name",
+        "__project_outdated",
+        "__array_info_outdated",
+        "__array_info_signature",
+        "__array_info_path",
+        "__cs_id",
+        "__omodel",
+        "__oarray",
+        "__cells",
+        "__cell_labels",
+        "__post_processing_cells",
+        "__props_cache",
+        "__props_design_properties",
+        "__component_indices",
+        "__oo_props_cache",
+        "__cs_ids",
+        "__cs_design_properties",
+        "__cs_names",
+        "__batch_depth",
+        "__batch_edit_pending",
+    )
+
     def __init__(self, app, name=None):
         # Public attributes
         self.logger = app.logger
@@ -41,9 +144,17 @@ class ComponentArray(object):
         self.__name = name
 
         # Leverage csv file if possible (aedt version > 2023.2)
+        # Before 2024R1, array information is read from the saved project, which is outdated after an edit or if the
+        # array definition changed
+        self.__project_outdated = False
+        # From 2024R1, the CSV file is exported when the array information is first needed, and again only after an
+        # edit or if the array definition changed
+        self.__array_info_outdated = False
+        # Array definition when the array information was last exported or saved
+        self.__array_info_signature = None
         if self.__app.settings.aedt_version > "2023.2":  # pragma: no cover
-            self.export_array_info(array_path=None)
-            self.__array_info_path = os.path.join(self.__app.toolkit_directory, "array_info.csv")
+            self.__array_info_path = self.__get_array_info_path()
+            self.__array_info_outdated = True
         else:
             self.__app.save_project()
             self.__array_info_path = None
@@ -57,8 +168,36 @@ class ComponentArray(object):
         self.__omodel = self.__app.get_oo_object(self.__app.odesign, "Model")
         self.__oarray = self.__app.get_oo_object(self.__omodel, name)
         self.__cells = None
+        self.__cell_labels = []
+        # Cell state is stored row by row in parallel lists that are shared with the CellArray objects
+        self._cell_components = []
+        self._cell_rotations = []
+        self._cell_active = []
         self.__post_processing_cells = {}
 
+        # Parsed array properties, reused until the array information is exported again or the design properties change
+        self.__props_cache = None
+        # Design properties the cached properties were read from, kept so that their identity can be compared
+        self.__props_design_properties = None
+        # Component index by name, built with the cached properties
+        self.__component_indices = {}
+
+        # AEDT property values reused until the current array operation ends
+        self.__oo_props_cache = None
+
+        # Coordinate system IDs and names, mapped both ways and reused while the design properties are unchanged
+        self.__cs_ids = None
+        self.__cs_design_properties = None
+        self.__cs_names = None
+
+        # Edits requested between begin_batch and end_batch are sent to AEDT once, when the outermost batch ends
+        self.__batch_depth = 0
+        self.__batch_edit_pending = False
+
+        if not self.__array_info_path:
+            # The project was saved above
+            self.__array_info_signature = self.__array_definition_signature()
+
     @pyaedt_function_handler()
     def __getitem__(self, key):
         """Get cell object corresponding to a key (row, column).
@@ -73,38 +212,46 @@ class ComponentArray(object):
         :class:`pyaedt.modeler.cad.component_array.CellArray`
         """
 
-        if key[0] > self.a_size or key[1] > self.b_size:
-            self.logger.error("Specified cell does not exist.")
-            return False
+        with self.__oo_properties_cached():
+            if key[0] > self.a_size or key[1] > self.b_size:
+                self.logger.error("Specified cell does not exist.")
+                return False
 
-        if key[0] <= 0 or key[1] <= 0:
-            self.logger.error("Row and column index start with ``1``.")
-            return False
+            if key[0] <= 0 or key[1] <= 0:
+                self.logger.error("Row and column index start with ``1``.")
+                return False
 
-        return self.cells[key[0] - 1][key[1] - 1]
+            return self.cells[key[0] - 1][key[1] - 1]
 
     @property
     def component_names(self):
         """List of component names."""
         return self.properties["component"]
 
+    @pyaedt_function_handler()
+    def _get_component_indices(self):
+        """Get the component indices by name from the updated array properties.
+
+        Returns
+        -------
+        dict
+            Component index by component name.
+        """
+        if not self.properties:  # pragma: no cover
+            return {}
+        return self.__component_indices
+
     @property
     def cells(self):
-        """List of :class:`pyaedt.modeler.cad.component_array.CellArray` objects."""
-        if not self.update_cells:
-            return self.__cells
+        """List of :class:`pyaedt.modeler.cad.component_array.CellArray` objects.
 
-        if self.__app.settings.aedt_version > "2023.2":  # pragma: no cover
-            self.export_array_info(array_path=None)
-        else:
-            self.__app.save_project()
-
-        self.__cells = [[None for _ in range(self.b_size)] for _ in range(self.a_size)]
-        array_props = self.properties
-        component_names = self.component_names
-        for row_cell in range(0, self.a_size):
-            for col_cell in range(0, self.b_size):
-                self.__cells[row_cell][col_cell] = CellArray(row_cell, col_cell, array_props, component_names, self)
+        When ``update_cells`` is ``True``, cells are loaded again from AEDT on each access, except inside a batch
+        of cell edits. If the array edit at the end of a batch fails, the cell changes are kept and sent with the next
+        edit, and cells are not loaded again from AEDT until then. Use :func:`update_properties` to discard these
+        changes and load the cells from AEDT.
+        """
+        if self.__cells is None or (self.update_cells and not self.__batch_depth and not self.__batch_edit_pending):
+            self.__build_cells()
         return self.__cells
 
     @property
@@ -121,34 +268,45 @@ class ComponentArray(object):
                 self.__app.component_array_names = list(self.__app.omodelsetup.GetArrayNames())
                 del self.__app.component_array[self.__name]
                 self.__name = array_name
+                if self.__array_info_path:  # pragma: no cover
+                    # The array information is exported under the new name when it is needed again
+                    self.__array_info_path = self.__get_array_info_path()
         else:  # pragma: no cover
             self.logger.warning("Name %s already assigned in the design", array_name)
 
     @property
     def properties(self):
-        """Ordered dictionary of the properties of the component array."""
+        """Dictionary of the properties of the component array."""
         # From 2024R1, array information can be loaded from a CSV
+        if self.__array_info_path:  # pragma: no cover
+            # The cached properties are dropped when the array information is exported, which is needed after an edit
+            if self.__props_cache is not None and not self.__array_info_outdated:
+                return self.__props_cache
+            if not self.__array_info_exported():
+                self.export_array_info(array_path=self.__array_info_path)
         if self.__array_info_path and os.path.exists(self.__array_info_path):  # pragma: no cover
+            design_properties = None
             res = self.parse_array_info_from_csv(self.__array_info_path)
         else:
+            design_properties = self.__app.design_properties
+            if self.__props_cache is not None and design_properties is self.__props_design_properties:
+                return self.__props_cache
             res = self.__get_properties_from_aedt()
+        if not res:  # pragma: no cover
+            return res
+        self.__props_cache = res
+        self.__props_design_properties = design_properties
+        self.__component_indices = {name: index for index, name in res["component"].items()}
         return res
 
     @property
     def post_processing_cells(self):
         """Dictionary of each component's postprocessing cells."""
         if not self.__post_processing_cells:
-            self.__post_processing_cells = {}
-            component_info = {}
-            for row, row_info in enumerate(self.cells, start=1):
-                for col, col_info in enumerate(row_info, start=1):
-                    name = col_info.component
-                    component_info.setdefault(name, []).append([row, col])
-
-            for component_name, component_cells in component_info.items():
-                if component_name not in self.__post_processing_cells.keys() and component_name is not None:
-                    self.__post_processing_cells[component_name] = component_cells[0]
-
+            # Defaults are taken from the current cell state, which is only loaded if there is none yet
+            if self.__cells is None:
+                self.__build_cells()
+            self.__post_processing_cells = self.__default_post_processing_cells()
         return self.__post_processing_cells
 
     @post_processing_cells.setter
@@ -162,7 +320,7 @@ class ComponentArray(object):
     @property
     def visible(self):
         """Flag indicating if the array is visible."""
-        return self.__app.get_oo_property_value(self.__omodel, self.name, "Visible")
+        return self.__get_oo_property_value("Visible")
 
     @visible.setter
     def visible(self, val):
@@ -171,7 +329,7 @@ class ComponentArray(object):
     @property
     def show_cell_number(self):
         """Flag indicating if the array cell number is shown."""
-        return self.__app.get_oo_property_value(self.__omodel, self.name, "Show Cell Number")
+        return self.__get_oo_property_value("Show Cell Number")
 
     @show_cell_number.setter
     def show_cell_number(self, val):
@@ -180,12 +338,12 @@ class ComponentArray(object):
     @property
     def render_choices(self):
         """List of rendered name choices."""
-        return list(self.__oarray.GetPropValue("Render/Choices"))
+        return list(self.__get_oo_property_value("Render/Choices"))
 
     @property
     def render(self):
         """Array rendering."""
-        return self.__app.get_oo_property_value(self.__omodel, self.name, "Render")
+        return self.__get_oo_property_value("Render")
 
     @render.setter
     def render(self, val):
@@ -203,17 +361,17 @@ class ComponentArray(object):
     @property
     def a_vector_choices(self):
         """List of name choices for vector A."""
-        return list(self.__app.get_oo_property_value(self.__omodel, self.name, "A Vector/Choices"))
+        return list(self.__get_oo_property_value("A Vector/Choices"))
 
     @property
     def b_vector_choices(self):
         """List of name choices for vector B."""
-        return list(self.__app.get_oo_property_value(self.__omodel, self.name, "B Vector/Choices"))
+        return list(self.__get_oo_property_value("B Vector/Choices"))
 
     @property
     def a_vector_name(self):
         """Name of vector A."""
-        return self.__app.get_oo_property_value(self.__omodel, self.name, "A Vector")
+        return self.__get_oo_property_value("A Vector")
 
     @a_vector_name.setter
     def a_vector_name(self, val):
@@ -225,7 +383,7 @@ class ComponentArray(object):
     @property
     def b_vector_name(self):
         """Name of vector B."""
-        return self.__oarray.GetPropValue("B Vector")
+        return self.__get_oo_property_value("B Vector")
 
     @b_vector_name.setter
     def b_vector_name(self, val):
@@ -237,7 +395,7 @@ class ComponentArray(object):
     @property
     def a_size(self):
         """Number of cells in the vector A direction."""
-        return int(self.__app.get_oo_property_value(self.__omodel, self.name, "A Cell Count"))
+        return int(self.__get_oo_property_value("A Cell Count"))
 
     @a_size.setter
     def a_size(self, val):  # pragma: no cover
@@ -248,7 +406,7 @@ class ComponentArray(object):
     @property
     def b_size(self):
         """Number of cells in the vector B direction."""
-        return int(self.__app.get_oo_property_value(self.__omodel, self.name, "B Cell Count"))
+        return int(self.__get_oo_property_value("B Cell Count"))
 
     @b_size.setter
     def b_size(self, val):  # pragma: no cover
@@ -259,7 +417,7 @@ class ComponentArray(object):
     @property
     def padding_cells(self):
         """Number of padding cells."""
-        return int(self.__app.get_oo_property_value(self.__omodel, self.name, "Padding"))
+        return int(self.__get_oo_property_value("Padding"))
 
     @padding_cells.setter
     def padding_cells(self, val):
@@ -268,11 +426,7 @@ class ComponentArray(object):
     @property
     def coordinate_system(self):
         """Coordinate system name."""
-        cs_dict = self.__map_coordinate_system_to_id()
-        res = "Global"
-        for name, cs_id in cs_dict.items():
-            if cs_id == self.__cs_id:
-                res = name
+        res = self.__map_id_to_coordinate_system().get(self.__cs_id, "Global")
         if res == "Global":
             self.logger.warning("Coordinate system is not loaded. Save the project.")
         return res
@@ -284,23 +438,33 @@ class ComponentArray(object):
             self.logger.warning("Coordinate system is not loaded. Save the project.")
         else:
             self.__cs_id = cs_dict[name]
+            self.__cs_ids = None
+            self.__props_cache = None
             self.edit_array()
 
     @pyaedt_function_handler()
     def update_properties(self):
         """Update component array properties.
 
+        Use this method when the array has been modified outside of this object, for example in the AEDT interface.
+        Cell changes of a batch that could not be sent to AEDT are discarded, and the cells are loaded again.
+
         Returns
         -------
         dict
-           Ordered dictionary of the properties of the component array.
+           Dictionary of the properties of the component array.
         """
-        # From 2024R1, array information can be loaded from a CSV, and this method is not needed.
+        self.__batch_edit_pending = False
+        # From 2024R1, array information is exported again to a CSV, otherwise the project is saved
         if self.__app.settings.aedt_version > "2023.2":  # pragma: no cover
-            self.export_array_info(array_path=None)
+            self.export_array_info(array_path=self.__array_info_path)
         else:
             self.__app.save_project()
+            self.__project_outdated = False
+            self.__array_info_signature = self.__array_definition_signature()
         new_properties = self.properties
+        if self.__cells is not None:
+            self.__build_cells()
         # TODO : post_processing_cells property can not be retrieved, so if the length of the components and the
         #  property is different, the method will reset the property.
         if len(new_properties["component"]) != len(self.post_processing_cells):
@@ -344,6 +508,10 @@ class ComponentArray(object):
         if not array_path:  # pragma: no cover
             array_path = os.path.join(self.__app.toolkit_directory, "array_info.csv")
         self.__app.omodelsetup.ExportArray(self.name, array_path)
+        if self.__array_info_path and os.path.abspath(array_path) == os.path.abspath(self.__array_info_path):
+            self.__array_info_signature = self.__array_definition_signature()
+            self.__array_info_outdated = False
+            self.__props_cache = None
         return array_path
 
     @pyaedt_function_handler()
@@ -358,7 +526,7 @@ class ComponentArray(object):
         Returns
         -------
         dict
-           Ordered dictionary of the properties of the component array.
+           Dictionary of the properties of the component array.
 
         Examples
         --------
@@ -370,78 +538,47 @@ class ComponentArray(object):
         >>> array_info = array.array_info_parser(array_csv)
         """
 
-        info = read_csv(csv_file)
-        if not info:
-            self.logger.error("Data from CSV file is not loaded.")
-            return False
+        components_str = ["Component Index", "Component Name"]
+        sources_str = ["Source Row", "Source Column", "Source Name", "Magnitude", "Phase"]
+        array_str = ["Array", "Format: Component_index:Rotation_angle:Active_or_Passive"]
 
         components = {}
         array_matrix = []
         array_matrix_rotation = []
         array_matrix_active = []
 
-        # Components
-        start_str = ["Component Index", "Component Name"]
-        end_str = ["Source Row", "Source Column", "Source Name", "Magnitude", "Phase"]
-
-        capture_data = False
-        line_cont = 0
-        for element_data in info:
-            if element_data == start_str:
-                capture_data = True
-            elif element_data == end_str:
-                break
-            elif capture_data:
-                components[int(float(element_data[0]))] = element_data[1]
-            line_cont += 1
-
-        # Array matrix
-        start_str = ["Array", "Format: Component_index:Rotation_angle:Active_or_Passive"]
-        capture_data = False
-
-        for element_data in info[line_cont + 1 :]:
-            if capture_data:
-                rows = element_data[:-1]
-                component_index = []
-                rotation = []
-                active_passive = []
-
-                for row in rows:
-                    split_elements = row.split(":")
-
-                    # Check for non-empty strings
-                    if split_elements[0]:
-                        component_index.append(int(split_elements[0]))
-                    else:
-                        component_index.append(-1)
-
-                    # Some elements might not have the rotation and active/passive status, so we check for their
-                    # existence
-                    if split_elements[0] and len(split_elements) > 1:
-                        string_part = re.findall("[a-zA-Z]+", split_elements[1])
-                        if string_part and string_part[0] == "deg":
-                            rot = re.findall(r"[+-]?\d+\.\d+", split_elements[1])
-                            rotation.append(int(float(rot[0])))
-                            if len(split_elements) > 2:
-                                active_passive.append(bool(int(split_elements[2])))
-                            else:
-                                active_passive.append(True)
-                        else:
-                            active_passive.append(False)
-                            rotation.append(0)
-                    elif split_elements[0]:
-                        active_passive.append(True)
-                        rotation.append(0)
-                    else:
-                        active_passive.append(False)
-                        rotation.append(0)
-
-                array_matrix.append(component_index)
-                array_matrix_rotation.append(rotation)
-                array_matrix_active.append(active_passive)
-            elif element_data == start_str:
-                capture_data = True
-        res = OrderedDict()
+        # Rows are read one at a time, only the components and the array matrix sections are kept
+        section = None
+        element_data = None
+        cells_info_cache = _CellInfoCache()
+        with io.open(csv_file, "r", encoding="utf-8", newline="", buffering=1 << 20) as csv_data:
+            for element_data in csv.reader(csv_data, delimiter=","):
+                if element_data == components_str:
+                    section = "components"
+                elif element_data == sources_str:
+                    section = None
+                elif element_data == array_str:
+                    section = "array"
+                elif section == "components":
+                    components[int(float(element_data[0]))] = element_data[1]
+                elif section == "array":
+                    # Each row ends with a separator, so its last element is always empty
+                    del element_data[-1:]
+                    # Cell information is transposed into the component index, rotation, and active rows at once
+                    cells_info = zip(*[cells_info_cache[cell] for cell in element_data])
+                    row_components, row_rotations, row_active = [list(row) for row in cells_info] or [[], [], []]
+                    array_matrix.append(row_components)
+                    array_matrix_rotation.append(row_rotations)
+                    array_matrix_active.append(row_active)
+
+        if element_data is None:
+            self.logger.error("Data from CSV file is not loaded.")
+            return False
+        if section != "array":
+            self.logger.error("Array information is not found in the CSV file.")
+            return False
+
+        res = {}
         res["component"] = components
         res["active"] = array_matrix_active
         res["rotation"] = array_matrix_rotation
@@ -452,6 +589,8 @@ class ComponentArray(object):
     def edit_array(self):
         """Edit component array.
 
+        Between :func:`begin_batch` and :func:`end_batch`, the edit is deferred until the batch ends.
+
         Returns
         -------
         bool
@@ -462,85 +601,165 @@ class ComponentArray(object):
 
         >>> oModule.EditArray
         """
+        if self.__batch_depth:
+            self.__batch_edit_pending = True
+            return True
+
+        with self.__oo_properties_cached():
+            a_size = self.a_size
+            b_size = self.b_size
+            args = [
+                "NAME:" + self.name,
+                "Name:=",
+                self.name,
+                "UseAirObjects:=",
+                True,
+                "RowPrimaryBnd:=",
+                self.a_vector_name,
+                "ColumnPrimaryBnd:=",
+                self.b_vector_name,
+                "RowDimension:=",
+                a_size,
+                "ColumnDimension:=",
+                b_size,
+                "Visible:=",
+                self.visible,
+                "ShowCellNumber:=",
+                self.show_cell_number,
+                "RenderType:=",
+                self.render_id,
+                "Padding:=",
+                self.padding_cells,
+                "ReferenceCSID:=",
+                self.__cs_id,
+            ]
+
+            # Group cell indices by component and rotation, and select the active ones
+            if self.update_cells and not self.__batch_edit_pending:
+                self.__build_cells()
+            cell_active = self._cell_active
+            cell_labels = self.__cell_labels
+            component_info = defaultdict(list)
+            for index, component in enumerate(self._cell_components):
+                component_info[component].append(index)
+            component_rotation = defaultdict(list)
+            for index, rotation in enumerate(self._cell_rotations):
+                component_rotation[rotation].append(index)
+            component_active = list(compress(range(len(cell_active)), cell_active))
+
+            cells = ["NAME:Cells"]
+            for component_name, component_cells in component_info.items():
+                if component_name:
+                    cells.append(component_name + ":=")
+                    cells.append([_cells_to_string(component_cells, cell_labels)])
+
+            rotations = ["NAME:Rotation"]
+            for rotation, rotation_cells in component_rotation.items():
+                rotations.append(str(rotation) + " deg:=")
+                rotations.append([_cells_to_string(rotation_cells, cell_labels)])
+
+            args.append(cells)
+            args.append(rotations)
+
+            args.append("Active:=")
+            if component_active:
+                args.append(_cells_to_string(component_active, cell_labels))
+            else:  # pragma: no cover
+                args.append("All")
+
+            post = ["NAME:PostProcessingCells"]
+            for component_name, values in self.post_processing_cells.items():
+                post.append(component_name + ":=")
+                post.append([str(values[0]), str(values[1])])
+            args.append(post)
+            args.append("Colors:=")
+            col = []
+            args.append(col)
+            self.__app.omodelsetup.EditArray(args)
+            self.__batch_edit_pending = False
+            self.__props_cache = None
+            self.__project_outdated = True
+            self.__array_info_outdated = True
+            return True
 
-        args = [
-            "NAME:" + self.name,
-            "Name:=",
-            self.name,
-            "UseAirObjects:=",
-            True,
-            "RowPrimaryBnd:=",
-            self.a_vector_name,
-            "ColumnPrimaryBnd:=",
-            self.b_vector_name,
-            "RowDimension:=",
-            self.a_size,
-            "ColumnDimension:=",
-            self.b_size,
-            "Visible:=",
-            self.visible,
-            "ShowCellNumber:=",
-            self.show_cell_number,
-            "RenderType:=",
-            self.render_id,
-            "Padding:=",
-            self.padding_cells,
-            "ReferenceCSID:=",
-            self.__cs_id,
-        ]
+    @pyaedt_function_handler()
+    def begin_batch(self):
+        """Start a batch of cell edits.
 
-        cells = ["NAME:Cells"]
-        component_info = {}
-        cells_obj = self.cells[:]
-        for row, row_info in enumerate(cells_obj, start=1):
-            for col, col_info in enumerate(row_info, start=1):
-                name = col_info.component
-                component_info.setdefault(name, []).append([row, col])
-
-        for component_name, component_cells in component_info.items():
-            if component_name:
-                cells.append(component_name + ":=")
-                component_cells_str = ", ".join(str(item) for item in component_cells)
-                cells.append([component_cells_str])
-
-        rotations = ["NAME:Rotation"]
-        component_rotation = {}
-        for row, row_info in enumerate(cells_obj, start=1):
-            for col, col_info in enumerate(row_info, start=1):
-                component_rotation.setdefault(col_info.rotation, []).append([row, col])
-
-        for rotation, rotation_cells in component_rotation.items():
-            rotations.append(str(rotation) + " deg:=")
-            component_cells_str = ", ".join(str(item) for item in rotation_cells)
-            rotations.append([component_cells_str])
-
-        args.append(cells)
-        args.append(rotations)
-
-        args.append("Active:=")
-
-        component_active = []
-        for row, row_info in enumerate(cells_obj, start=1):
-            for col, col_info in enumerate(row_info, start=1):
-                if col_info.is_active:
-                    component_active.append([row, col])
-
-        if component_active:
-            args.append(", ".join(str(item) for item in component_active))
-        else:  # pragma: no cover
-            args.append("All")
-
-        post = ["NAME:PostProcessingCells"]
-        for component_name, values in self.post_processing_cells.items():
-            post.append(component_name + ":=")
-            post.append([str(values[0]), str(values[1])])
-        args.append(post)
-        args.append("Colors:=")
-        col = []
-        args.append(col)
-        self.__app.omodelsetup.EditArray(args)
+        Until :func:`end_batch` is called, cell changes are kept in the cell objects and the array is not edited in
+        AEDT. Batches can be nested, in which case the array is edited when the outermost batch ends.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        Examples
+        --------
+        >>> from pyaedt import Hfss
+        >>> aedtapp = Hfss(projectname="Array.aedt")
+        >>> array = aedtapp.component_array["A1"]
+        >>> array.begin_batch()
+        >>> for row in array.cells:
+        ...     for cell in row:
+        ...         cell.rotation = 90
+        >>> array.end_batch()
+        """
+        if not self.__batch_depth and self.update_cells and not self.__batch_edit_pending:
+            self.__build_cells()
+        self.__batch_depth += 1
         return True
 
+    @pyaedt_function_handler()
+    def end_batch(self):
+        """End a batch of cell edits and edit the array once if any cell has changed.
+
+        When batches are nested, only the end of the outermost batch edits the array. If the edit fails, the cell
+        changes are kept and sent with the next edit.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+
+        >>> oModule.EditArray
+        """
+        if self.__batch_depth:
+            self.__batch_depth -= 1
+        if self.__batch_depth or not self.__batch_edit_pending:
+            return True
+        update_cells = self.update_cells
+        self.update_cells = False
+        try:
+            return self.edit_array()
+        finally:
+            self.update_cells = update_cells
+
+    @contextmanager
+    def batch_updates(self):
+        """Edit the array in AEDT once for all cell changes made in a ``with`` block.
+
+        This context manager calls :func:`begin_batch` on entry and :func:`end_batch` on exit.
+
+        Examples
+        --------
+        >>> from pyaedt import Hfss
+        >>> aedtapp = Hfss(projectname="Array.aedt")
+        >>> array = aedtapp.component_array["A1"]
+        >>> with array.batch_updates():
+        ...     for row in array.cells:
+        ...         for cell in row:
+        ...             cell.rotation = 90
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
     @pyaedt_function_handler()
     def get_cell(self, row, col):
         """Get cell object corresponding to a row and column.
@@ -568,6 +787,184 @@ class ComponentArray(object):
         """
         return self.__app.omodelsetup.GetLatticeVectors()
 
+    def __build_cells(self):
+        """Update the cells from the array properties.
+
+        Errors are not handled here, so that the calling operation fails instead of using the previous cell state.
+        """
+        with self.__oo_properties_cached():
+            a_size = self.a_size
+            b_size = self.b_size
+            if self.__app.settings.aedt_version > "2023.2":  # pragma: no cover
+                # The array information is exported again when read if the array definition changed since the last
+                # export
+                if self.__array_definition_signature() != self.__array_info_signature:
+                    self.__array_info_outdated = True
+            else:
+                # The project is saved again if the array was edited or its definition changed since the last save
+                signature = self.__array_definition_signature()
+                if self.__project_outdated or signature != self.__array_info_signature:
+                    self.__app.save_project()
+                    self.__project_outdated = False
+                    self.__array_info_signature = signature
+
+            array_props = self.properties
+            if not self.__cell_matrices_match(array_props, a_size, b_size):
+                # The array information does not match the array size, so it is read again once
+                if self.__array_info_path:  # pragma: no cover
+                    self.__array_info_outdated = True
+                else:
+                    self.__app.save_project()
+                    self.__project_outdated = False
+                array_props = self.properties
+                if not self.__cell_matrices_match(array_props, a_size, b_size):
+                    raise ValueError(
+                        "Array information of '{}' does not match the array size {}x{}.".format(
+                            self.name, a_size, b_size
+                        )
+                    )
+            component_names = self.component_names
+
+            # Flatten the row-major matrices into the cell state
+            self._cell_components = [
+                None if component_index == -1 else component_names[component_index]
+                for row_components in array_props["cells"]
+                for component_index in row_components
+            ]
+            self._cell_rotations = [rotation for row_rotations in array_props["rotation"] for rotation in row_rotations]
+            self._cell_active = [active for row_active in array_props["active"] for active in row_active]
+
+            # Cell objects and labels only depend on the cell position, so they are kept while the array size is
+            # unchanged
+            if not self.__cells or len(self.__cells) != a_size or len(self.__cells[0]) != b_size:
+                self.__cells = [
+                    [CellArray(row_cell, col_cell, self, row_cell * b_size + col_cell) for col_cell in range(b_size)]
+                    for row_cell in range(a_size)
+                ]
+                self.__cell_labels = [
+                    "[%d, %d]" % (row_cell, col_cell)
+                    for row_cell in range(1, a_size + 1)
+                    for col_cell in range(1, b_size + 1)
+                ]
+            if not self.__post_processing_cells:
+                self.__post_processing_cells = self.__default_post_processing_cells()
+
+    @staticmethod
+    @pyaedt_function_handler()
+    def __cell_matrices_match(array_props, a_size, b_size):
+        """Check that the cell matrices of the array properties have the array size.
+
+        Parameters
+        ----------
+        array_props : dict
+            Array properties.
+        a_size : int
+            Number of rows.
+        b_size : int
+            Number of columns.
+
+        Returns
+        -------
+        bool
+            ``True`` when all cell matrices have ``a_size`` rows of ``b_size`` values, ``False`` otherwise.
+        """
+        for key in ["cells", "rotation", "active"]:
+            matrix = array_props[key]
+            if len(matrix) != a_size or any(len(row) != b_size for row in matrix):
+                return False
+        return True
+
+    @pyaedt_function_handler()
+    def __array_definition_signature(self):
+        """Get the array definition values that the exported array information depends on.
+
+        Returns
+        -------
+        tuple
+            Coordinate system ID, array size, and lattice vectors.
+        """
+        with self.__oo_properties_cached():
+            return self.__cs_id, self.a_size, self.b_size, tuple(self.lattice_vector())
+
+    @pyaedt_function_handler()
+    def __get_array_info_path(self):
+        """Get the path of the CSV file that the array information is loaded from.
+
+        Each array has its own file, so that arrays of other designs do not overwrite it.
+
+        Returns
+        -------
+        str
+            Full path of the CSV file.
+        """
+        file_name = "array_info_{}_{}.csv".format(self.__app.design_name, self.name)
+        return os.path.join(self.__app.toolkit_directory, file_name)
+
+    @pyaedt_function_handler()
+    def __array_info_exported(self):
+        """Check whether the CSV file holds the last array information exported by this array.
+
+        Returns
+        -------
+        bool
+            ``True`` when the file exists and is up to date, ``False`` otherwise.
+        """
+        return not self.__array_info_outdated and os.path.exists(self.__array_info_path)
+
+    @pyaedt_function_handler()
+    def __default_post_processing_cells(self):
+        """Get the first cell of each component, which is its default postprocessing cell.
+
+        Returns
+        -------
+        dict
+            Dictionary of each component's postprocessing cell.
+        """
+        b_size = len(self.__cells[0]) if self.__cells else 0
+        positions = product(range(1, len(self.__cells) + 1), range(1, b_size + 1))
+        post_processing_cells = {}
+        for (row, col), component in zip(positions, self._cell_components):
+            if component is not None and component not in post_processing_cells:
+                post_processing_cells[component] = [row, col]
+        return post_processing_cells
+
+    @pyaedt_function_handler()
+    def __get_oo_property_value(self, prop_name):
+        """Get an array property value from AEDT.
+
+        Parameters
+        ----------
+        prop_name : str
+            Name of the property.
+
+        Returns
+        -------
+        str, float, bool
+            Value of the property. Inside an array operation, the value read the first time is reused.
+        """
+        if self.__oo_props_cache is not None and prop_name in self.__oo_props_cache:
+            return self.__oo_props_cache[prop_name]
+        # The array object is kept, so each value is read with a single call
+        try:
+            value = self.__oarray.GetPropValue(prop_name)
+        except:
+            value = None
+        if self.__oo_props_cache is not None:
+            self.__oo_props_cache[prop_name] = value
+        return value
+
+    @contextmanager
+    def __oo_properties_cached(self):
+        """Reuse the AEDT property values read until the outermost array operation ends."""
+        if self.__oo_props_cache is not None:
+            yield
+            return
+        self.__oo_props_cache = {}
+        try:
+            yield
+        finally:
+            self.__oo_props_cache = None
+
     @pyaedt_function_handler()
     def __get_properties_from_aedt(self):
         """Get array properties from an AEDT file.
@@ -575,7 +972,7 @@ class ComponentArray(object):
         Returns
         -------
         dict
-            Ordered dictionary of the properties of the component array.
+            Dictionary of the properties of the component array.
 
         """
         props = self.__app.design_properties
@@ -593,7 +990,7 @@ class ComponentArray(object):
         for c in components_map:
             m = re.search(r"'(\d+)'=(\d+)", c)
             components[int(m.group(1))] = component_id[int(m.group(2))]
-        res = OrderedDict()
+        res = {}
         res["component"] = components
         res["active"] = props["ArrayDefinition"]["ArrayObject"]["Active"]["matrix"]
         res["rotation"] = props["ArrayDefinition"]["ArrayObject"]["Rotation"]["matrix"]
@@ -609,9 +1006,12 @@ class ComponentArray(object):
         dict
             Coordinate system ID.
         """
+        design_properties = self.__app.design_properties
+        if self.__cs_ids is not None and design_properties is self.__cs_design_properties:
+            return self.__cs_ids
         res = {"Global": 1}
-        if self.__app.design_properties and "ModelSetup" in self.__app.design_properties:  # pragma: no cover
-            cs = self.__app.design_properties["ModelSetup"]["GeometryCore"]["GeometryOperations"]["CoordinateSystems"]
+        if design_properties and "ModelSetup" in design_properties:  # pragma: no cover
+            cs = design_properties["ModelSetup"]["GeometryCore"]["GeometryOperations"]["CoordinateSystems"]
             for _, val in cs.items():
                 try:
                     if isinstance(val, dict):
@@ -622,8 +1022,25 @@ class ComponentArray(object):
                         res[name] = cs_id
                 except AttributeError:
                     pass
+        self.__cs_ids = res
+        self.__cs_design_properties = design_properties
+        self.__cs_names = None
         return res
 
+    @pyaedt_function_handler()
+    def __map_id_to_coordinate_system(self):
+        """Map ID to coordinate system.
+
+        Returns
+        -------
+        dict
+            Coordinate system name.
+        """
+        cs_ids = self.__map_coordinate_system_to_id()
+        if self.__cs_names is None:
+            self.__cs_names = {cs_id: name for name, cs_id in cs_ids.items()}
+        return self.__cs_names
+
 
 class CellArray(object):
     """Manages object attributes for a 3D component and a user-defined model.
@@ -634,44 +1051,32 @@ class CellArray(object):
         Row index of the cell.
     col : int
         Column index of the cell.
-    array_props : dict
-        Dictionary containing the properties of the array.
-    component_names : list
-        List of component names in the array.
     array_obj : class:`pyaedt.modeler.cad.component_array.ComponentArray`
         Instance of the array containing the cell.
+    index : int
+        Index of the cell in the array cell state, which is stored row by row.
 
     """
 
-    def __init__(self, row, col, array_props, component_names, array_obj):
+    __slots__ = ("__row", "__col", "__array_obj", "__index")
+
+    def __init__(self, row, col, array_obj, index):
         self.__row = row + 1
         self.__col = col + 1
         self.__array_obj = array_obj
-        self.__cell_props = OrderedDict(
-            {
-                "component": array_props["cells"][row][col],
-                "active": array_props["active"][row][col],
-                "rotation": array_props["rotation"][row][col],
-            }
-        )
-        self.__rotation = self.__cell_props["rotation"]
-        self.__is_active = self.__cell_props["active"]
-
-        component_index = self.__cell_props["component"]
-        if component_index == -1:
-            self.__component = None
-        else:
-            self.__component = component_names[component_index]
+        self.__index = index
 
     @property
     def rotation(self):
         """Rotation value of the cell object."""
-        return self.__rotation
+        return self.__array_obj._cell_rotations[self.__index]
 
     @rotation.setter
     def rotation(self, val):
         if val in [0, 90, 180, 270]:
-            self.__rotation = val
+            if val == self.rotation:
+                return
+            self.__array_obj._cell_rotations[self.__index] = val
             self.__array_obj.update_cells = False
             self.__array_obj.edit_array()
             self.__array_obj.update_cells = True
@@ -681,12 +1086,13 @@ class CellArray(object):
     @property
     def component(self):
         """Component name of the cell object."""
-        return self.__component
+        return self.__array_obj._cell_components[self.__index]
 
     @component.setter
     def component(self, val):
-        component_names = self.__array_obj.component_names
-        if val in component_names.values() or val is None:
+        if val is None or val in self.__array_obj._get_component_indices():
+            if val == self.component:
+                return
             self.__array_obj.update_cells = False
             if val is None:
                 post_processing_cells = self.__array_obj.post_processing_cells
@@ -698,7 +1104,7 @@ class CellArray(object):
                                 self.__array_obj.post_processing_cells[self.component] = [cell.row, cell.col]
                                 break
                         break
-            self.__component = val
+            self.__array_obj._cell_components[self.__index] = val
             self.__array_obj.edit_array()
             self.__array_obj.update_cells = True
         else:  # pragma: no cover
@@ -707,12 +1113,14 @@ class CellArray(object):
     @property
     def is_active(self):
         """Flag indicating if the cell object is active or passive."""
-        return self.__is_active
+        return self.__array_obj._cell_active[self.__index]
 
     @is_active.setter
     def is_active(self, val):
         if isinstance(val, bool):
-            self.__is_active = val
+            if val == self.is_active:
+                return
+            self.__array_obj._cell_active[self.__index] = val
             self.__array_obj.update_cells = False
             self.__array_obj.edit_array()
             self.__array_obj.update_cells = True